@@ -3,12 +3,12 @@ from typing import NamedTuple, Optional, Union, Sequence
 
 import bpy
 
-from ..internal.types import Vector3d
+from ..internal.types import Vector4d
 
 
 class ColorsMetadata(NamedTuple):
     type: type
-    color: Optional[Vector3d]
+    color: Optional[Vector4d]  # uniform color in RGBA format (alpha is 1 for RGB colors)
     has_alpha: bool
     texture: Optional[bpy.types.Image]
 
@@ -21,7 +21,6 @@ class ColorsMetadata(NamedTuple):
 class Colors(ABC):
     """An abstract container template for storing the object coloring information
     """
-
     @abstractmethod
     def __init__(self):
         self._metadata: Optional[ColorsMetadata] = None
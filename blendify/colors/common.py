@@ -23,9 +23,11 @@ class VertexColors(Colors):
             "Colors should be stored as floating point numbers (np.float32 or np.float64)"
         assert np.all(vertex_colors >= 0) and np.all(vertex_colors <= 1), "Colors should be in range [0.0, 1.0]"
         has_alpha = vertex_colors.shape[1] == 4
+        # Store colors as contiguous float32 RGBA, so that they can be passed to Blender without conversion
+        self._vertex_colors = np.empty((vertex_colors.shape[0], 4), dtype=np.float32)
+        self._vertex_colors[:, :vertex_colors.shape[1]] = vertex_colors
         if not has_alpha:
-            vertex_colors = np.hstack([vertex_colors, np.ones((vertex_colors.shape[0], 1), dtype=vertex_colors.dtype)])
-        self._vertex_colors = vertex_colors.copy()
+            self._vertex_colors[:, 3] = 1.
         self._metadata = ColorsMetadata(
             type=self.__class__,
             has_alpha=has_alpha,
@@ -38,7 +40,7 @@ class VertexColors(Colors):
         """Get current colors
 
         Returns:
-            np.ndarray: current vertex colors
+            np.ndarray: current vertex colors, float32 array of size (N,4)
         """
         return self._vertex_colors
 
@@ -54,14 +56,18 @@ class UniformColors(Colors):
             uniform_color (Vector3d): a color in RGB format (to change alpha, use 'alpha' material property instead)
         """
         super().__init__()
-        uniform_color = np.array(uniform_color)
-        assert len(uniform_color) in (3, 4), "Color should be in RGB or RGBA format"
-        assert uniform_color.max() <= 1. and uniform_color.min() >= 0., "Color values should be in [0,1] range"
-        self._color = uniform_color
+        # At most four values are checked as Python floats, which is cheaper than NumPy reductions
+        values = [float(x) for x in np.asarray(uniform_color).ravel()]
+        assert len(values) in (3, 4), "Color should be in RGB or RGBA format"
+        assert max(values) <= 1. and min(values) >= 0., "Color values should be in [0,1] range"
+        self._color = np.array(values)
+        has_alpha = len(values) == 4
+        # Passed to Blender as is, a tuple of floats does not need conversion in the socket value setter
+        rgba = tuple(values) if has_alpha else (*values, 1.)
         self._metadata = ColorsMetadata(
             type=self.__class__,
-            has_alpha=self._color.shape[0] == 4,
-            color=self._color,
+            has_alpha=has_alpha,
+            color=rgba,
             texture=None
         )
 
@@ -174,16 +174,14 @@ class Positionable(ABC):
 
     def _blender_remove_object(self):
         """Removes the object from Blender scene"""
-        bpy.ops.object.select_all(action='DESELECT')
         is_collection = isinstance(self._blender_object, bpy.types.Collection)
         if is_collection:
-            for obj in self._blender_object.all_objects.values():
-                obj.select_set(True)
+            objects = self._blender_object.all_objects.values()
         else:
-            bpy.context.view_layer.objects.active = self._blender_object
-            bpy.ops.object.mode_set(mode='OBJECT')
-            self._blender_object.select_set(True)
-        bpy.ops.object.delete()
+            objects = [self._blender_object]
+        # Objects are removed from the data directly, no operator, selection or context is involved
+        for obj in objects:
+            bpy.data.objects.remove(obj, do_unlink=True)
         if is_collection:
             bpy.data.collections.remove(self._blender_object)
         self._blender_object = None
@@ -24,37 +24,63 @@ SOFTWARE.
 """
 
 import bpy
+import numpy as np
 
 
-def compute_particle_color_texture(colors, name="ParticleColor"):
-    # To view the texture we set the height of the texture to vis_image_height
-    image = bpy.data.images.new(name=name, width=len(colors), height=1)
+def compute_particle_color_texture(colors, name="ParticleColor", width=None):
+    """Creates a texture with a pixel for each particle color, colors are laid out row by row starting from
+    the bottom left corner of the texture
 
-    _copy_values_to_image(colors, image.name)
-    image = bpy.data.images[image.name]
+    Args:
+        colors (np.ndarray): per-particle colors of shape (N, 4), expected to be C-contiguous float32 RGBA
+            so that the pixels can be uploaded without any conversion
+        name (str, optional): name of the Blender image (default: "ParticleColor")
+        width (int, optional): number of pixels in each row, a single-row texture is created if None (default: None)
+
+    Returns:
+        bpy.types.Image: packed Blender image with particle colors
+    """
+    if width is None:
+        width = len(colors)
+    height = (len(colors) + width - 1) // width
+    # The texture is sampled with "Closest" interpolation as a lookup table,
+    # so 8 bits per channel are enough and the image is stored as a byte buffer.
+    # Pixels are always RGBA, the alpha channel is kept to support transparent per-vertex colors
+    image = bpy.data.images.new(name=name, width=width, height=height, alpha=True, float_buffer=False)
+
+    update_particle_color_texture(image, colors)
     # https://docs.blender.org/api/current/bpy.types.Image.html#bpy.types.Image.pack
     image.pack()
     return image
 
 
+def update_particle_color_texture(image, colors):
+    """Writes particle colors to the pixels of a texture created with compute_particle_color_texture
+
+    Args:
+        image (bpy.types.Image): texture with particle colors
+        colors (np.ndarray): per-particle colors of shape (N, 4), expected to be C-contiguous float32 RGBA
+    """
+    num_pixels = image.size[0] * image.size[1]
+    colors = np.ascontiguousarray(colors, dtype=np.float32)
+    if len(colors) < num_pixels:
+        # The last row of the texture is only partially filled
+        # Each element is written once: colors are copied and only the unused tail is zeroed
+        padded_colors = np.empty((num_pixels, 4), dtype=np.float32)
+        padded_colors[:len(colors)] = colors
+        padded_colors[len(colors):] = 0.
+        colors = padded_colors
+    image.pixels.foreach_set(colors.ravel())
+
+
 def _copy_values_to_image(value_tuples, image_name):
     """ Copy values to image pixels
     """
     image = bpy.data.images[image_name]
-    # working on a copy of the pixels results in a MASSIVE performance speed
-    local_pixels = list(image.pixels[:])
-    for value_index, value_tuple in enumerate(value_tuples):
-        column_offset = value_index * 4  # (R,G,B,A)
-        # Order is R,G,B, opacity
-        local_pixels[column_offset] = value_tuple[0]
-        local_pixels[column_offset + 1] = value_tuple[1]
-        local_pixels[column_offset + 2] = value_tuple[2]
-
-        # opacity (0 = transparent, 1 = opaque)
-        if len(value_tuple) == 4:
-            local_pixels[column_offset + 3] = value_tuple[3]
-        else:
-            # local_pixels[column_offset + 3] = 1.0    # already set by default
-            pass
-
-    image.pixels = local_pixels[:]
+    values = np.asarray(value_tuples, dtype=np.float32)
+    # Order is R,G,B, opacity (0 = transparent, 1 = opaque), the missing opacity is set to 1
+    local_pixels = np.empty((len(values), 4), dtype=np.float32)
+    local_pixels[:, :values.shape[1]] = values
+    if values.shape[1] == 3:
+        local_pixels[:, 3] = 1.0
+    image.pixels.foreach_set(local_pixels.ravel())
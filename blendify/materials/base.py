@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Sequence, Union, Dict, Optional
+from typing import Sequence, Union, Dict, Optional, Tuple, Set, Any
 from dataclasses import dataclass
 
 import bpy
@@ -11,19 +11,94 @@ class MaterialInstance:
     inputs: Dict[str, bpy.types.NodeSocket]
     colors_node: Optional[bpy.types.ShaderNode] = None
 
+    def copy(self, name: str) -> "MaterialInstance":
+        """Duplicates the Blender material together with its node tree, which is much faster than building
+        the node tree again. The colors node is expected to be added to the copy separately
+
+        Args:
+            name (str): a unique name for the copied Blender material
+
+        Returns:
+            MaterialInstance: instance with the copied material and inputs pointing to the copied node tree
+        """
+        blender_material = self.blender_material.copy()
+        blender_material.name = name
+        node_tree = blender_material.node_tree
+        inputs = {key: node_tree.path_resolve(socket.path_from_id()) for key, socket in self.inputs.items()}
+        return MaterialInstance(blender_material=blender_material, inputs=inputs)
+
 
 class Material(ABC):
     def __init__(self):
-        pass
+        self._template: Optional[MaterialInstance] = None
+        # Names of the nodes and values of the inputs of the template right after it was created
+        self._template_state: Optional[Tuple[Set[str], Dict[str, Any]]] = None
 
     @abstractmethod
     def create_material(self, name: str = "object_material") -> MaterialInstance:
         pass
 
+    def _blender_create_instance(self, name: str = "object_material") -> MaterialInstance:
+        """Creates the Blender material for a renderable. The node tree is built with create_material only once,
+        the first created material is kept as a template and further materials are copied from it
+
+        Args:
+            name (str): a unique material name for Blender
+
+        Returns:
+            MaterialInstance: created Blender material and the inputs of its shader node
+        """
+        # Subclasses written before templates were introduced may not call Material.__init__
+        template = getattr(self, "_template", None)
+        if template is not None:
+            try:
+                template.blender_material.name
+            except ReferenceError:
+                # The template was removed together with the renderable that used it (or on Scene.clear)
+                template = None
+        if template is None:
+            material_instance = self.create_material(name=name)
+            node_names = {node.name for node in material_instance.blender_material.node_tree.nodes}
+            input_values = dict()
+            for key, socket in material_instance.inputs.items():
+                value = getattr(socket, "default_value", None)
+                if value is not None:
+                    input_values[key] = tuple(value) if hasattr(value, "__len__") else value
+            self._template = material_instance
+            self._template_state = (node_names, input_values)
+            return material_instance
+
+        # The template is used by a renderable, nodes and input values added by it are reverted in the copy
+        material_instance = template.copy(name)
+        node_names, input_values = self._template_state
+        nodes = material_instance.blender_material.node_tree.nodes
+        for node in [node for node in nodes if node.name not in node_names]:
+            nodes.remove(node)
+        for key, value in input_values.items():
+            material_instance.inputs[key].default_value = value
+        return material_instance
+
 
 MaterialList = Sequence[Material]
 
 
+def find_node(node_tree: bpy.types.NodeTree, bl_idname: str) -> Optional[bpy.types.Node]:
+    """Finds the first node of the given type in the node tree. Unlike the lookup by node name,
+    does not depend on the names of the default nodes, which are translated with the Blender UI language
+
+    Args:
+        node_tree (bpy.types.NodeTree): node tree to search in
+        bl_idname (str): type of the node, e.g. "ShaderNodeBsdfPrincipled"
+
+    Returns:
+        Optional[bpy.types.Node]: the found node or None if the node tree has no nodes of this type
+    """
+    for node in node_tree.nodes:
+        if node.bl_idname == bl_idname:
+            return node
+    return None
+
+
 def material_property(name: str):
     """Creates a property for the material class to get one of the material parameters
 
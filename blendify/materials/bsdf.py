@@ -2,7 +2,7 @@ from typing import Tuple
 
 import bpy
 
-from .base import Material, material_property, MaterialInstance
+from .base import Material, material_property, MaterialInstance, find_node
 from .wireframe import WireframeMaterial
 
 
@@ -43,7 +43,7 @@ class PrincipledBSDFMaterial(Material):
 
         object_material = bpy.data.materials.new(name=name)
         object_material.use_nodes = True
-        bsdf_node = object_material.node_tree.nodes["Principled BSDF"]
+        bsdf_node = find_node(object_material.node_tree, "ShaderNodeBsdfPrincipled")
         material_instance = MaterialInstance(blender_material=object_material,
                                              inputs={"Color": bsdf_node.inputs["Base Color"], "Alpha": bsdf_node.inputs["Alpha"],
                                                      "Emission": bsdf_node.inputs["Emission"],
@@ -82,8 +82,8 @@ class GlossyBSDFMaterial(Material):
         material_nodes = object_material.node_tree.nodes
 
         bsdf_node = material_nodes.new("ShaderNodeBsdfGlossy")
-        material_nodes.remove(material_nodes['Principled BSDF'])
-        object_material.node_tree.links.new(material_nodes["Material Output"].inputs["Surface"],
+        material_nodes.remove(find_node(object_material.node_tree, "ShaderNodeBsdfPrincipled"))
+        object_material.node_tree.links.new(find_node(object_material.node_tree, "ShaderNodeOutputMaterial").inputs["Surface"],
                                             bsdf_node.outputs[0])
         # Set material properties
         bsdf_node.inputs["Roughness"].default_value = self._roughness
@@ -113,7 +113,7 @@ class PrincipledBSDFWireframeMaterial(WireframeMaterial, PrincipledBSDFMaterial)
         material_nodes = object_material.node_tree.nodes
 
         # Create BSDF
-        bsdf_node = object_material.node_tree.nodes["Principled BSDF"]
+        bsdf_node = find_node(object_material.node_tree, "ShaderNodeBsdfPrincipled")
 
         # Set BSDF properties
         for property_name, blender_name in self._property2blender_mapping.items():
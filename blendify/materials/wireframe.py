@@ -2,7 +2,7 @@ from typing import Tuple
 
 import bpy
 
-from .base import Material
+from .base import Material, find_node
 
 
 class WireframeMaterial(Material):
@@ -39,5 +39,5 @@ class WireframeMaterial(Material):
         object_material.node_tree.links.new(mix_node.inputs[2],
                                             diffuse_node.outputs[0])
 
-        object_material.node_tree.links.new(material_nodes["Material Output"].inputs["Surface"],
+        object_material.node_tree.links.new(find_node(object_material.node_tree, "ShaderNodeOutputMaterial").inputs["Surface"],
                                             mix_node.outputs[0])
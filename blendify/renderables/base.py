@@ -162,7 +162,7 @@ class RenderableObject(Renderable):
         self._material_instances = []
 
         for material in material_list:
-            material_instance = material.create_material()
+            material_instance = material._blender_create_instance()
             self._blender_object.data.materials.append(material_instance.blender_material)
             self._material_instances.append(material_instance)
         self._blender_create_colors_nodes()
@@ -175,10 +175,8 @@ class RenderableObject(Renderable):
         if self._material_instances is not None:
             self._blender_object.active_material = None
             for material_instance in self._material_instances:
-                material_nodes = material_instance.blender_material.node_tree.nodes
                 blender_material = material_instance.blender_material
-                for material_node in material_nodes:
-                    blender_material.node_tree.nodes.remove(material_node)
+                blender_material.node_tree.nodes.clear()
                 blender_material.user_clear()
                 bpy.data.materials.remove(blender_material)
             self._material_instances = None
@@ -235,10 +233,7 @@ class RenderableObject(Renderable):
                 blender_material = material_instance.blender_material
                 if colors_metadata.type is UniformColors:
                     colors_node = blender_material.node_tree.nodes.new('ShaderNodeRGB')
-                    if colors_metadata.has_alpha:
-                        colors_node.outputs["Color"].default_value = colors_metadata.color.tolist()
-                    else:
-                        colors_node.outputs["Color"].default_value = colors_metadata.color.tolist() + [1.]  # add alpha 1.0
+                    colors_node.outputs["Color"].default_value = colors_metadata.color
                 elif colors_metadata.type is VertexColors:
                     colors_node = blender_material.node_tree.nodes.new('ShaderNodeVertexColor')
                 elif colors_metadata.type is TextureColors:
@@ -1,6 +1,5 @@
 from typing import Sequence
 
-import bmesh
 import bpy
 import numpy as np
 
@@ -52,9 +51,13 @@ class Mesh(RenderableObject):
             tag (str): name of the created object in Blender
             faces_material (np.ndarray, optional): for each face, the material index assigned to it
         """
+        # Stored as int32 array, so that it can be passed to foreach_set without conversion
+        if faces_material is not None:
+            faces_material = np.ascontiguousarray(faces_material, dtype=np.int32)
+        assert faces_material is None or (len(faces_material) == len(faces)), \
+            f"Number of material faces should be equal to the number of faces ({len(faces)})"
         obj = self._blender_create_object(vertices, faces, tag)
         self._faces_material = faces_material
-        self._faces_count = len(faces)
         super().__init__(**kwargs, blender_object=obj, tag=tag)
 
     def _blender_create_object(
@@ -85,16 +88,9 @@ class Mesh(RenderableObject):
         Args:
             smooth (bool, optional): If True shade smooth else shade flat (default: True)
         """
-        bpy.context.view_layer.objects.active = self._blender_object
-        bpy.ops.object.mode_set(mode='EDIT')
-        bm = bmesh.from_edit_mesh(self._blender_mesh)
-        for face in bm.faces:
-            face.smooth = smooth
-        bpy.ops.object.mode_set(mode='OBJECT')
-        if smooth:
-            bpy.ops.object.shade_smooth()
-        else:
-            bpy.ops.object.shade_flat()
+        polygons = self._blender_mesh.polygons
+        polygons.foreach_set("use_smooth", np.full(len(polygons), smooth, dtype=bool))
+        self._blender_mesh.update()
 
     def _blender_set_colors(
             self,
@@ -105,37 +101,30 @@ class Mesh(RenderableObject):
         Args:
             colors_list (ColorsList): list of target colors
         """
+        mesh = self._blender_mesh
+        loop_vertices = None
         for colors in colors_list:
+            if isinstance(colors, (VertexColors, UVColors)) and loop_vertices is None:
+                # Index of the vertex for each face corner (loop), per-loop data is written with a single buffer copy
+                loop_vertices = np.empty(len(mesh.loops), dtype=np.int32)
+                mesh.loops.foreach_get("vertex_index", loop_vertices)
             if isinstance(colors, VertexColors):
-                bpy.context.view_layer.objects.active = self._blender_object
-                bpy.ops.object.mode_set(mode='EDIT')
-                bm = bmesh.from_edit_mesh(self._blender_mesh)
-                color_layer = bm.loops.layers.color.new("color")
-                for face in bm.faces:
-                    for loop in face.loops:
-                        loop[color_layer] = colors.vertex_colors[loop.vert.index]
-                bpy.ops.object.mode_set(mode='OBJECT')
-                self._blender_mesh.vertex_colors["color"].active_render = True
+                color_layer = mesh.vertex_colors.new(name="color")
+                color_layer.data.foreach_set("color", colors.vertex_colors[loop_vertices].ravel())
+                mesh.vertex_colors["color"].active_render = True
             elif isinstance(colors, UVColors):
-                bpy.context.view_layer.objects.active = self._blender_object
-                bpy.ops.object.mode_set(mode='EDIT')
-                self._blender_mesh.uv_layers.new(name='NewUVMap')
-                bm = bmesh.from_edit_mesh(self._blender_mesh)
-                uv_layer = bm.loops.layers.uv.active
+                uv_layer = mesh.uv_layers.new(name='NewUVMap')
                 uv_map = colors.uv_map
                 if isinstance(uv_map, VertexUV):
-                    for face in bm.faces:
-                        for loop in face.loops:
-                            loop_uv = loop[uv_layer]
-                            loop_uv.uv = uv_map.data[loop.vert.index].tolist()
+                    loop_uv = np.asarray(uv_map.data, dtype=np.float32)[loop_vertices]
                 elif isinstance(uv_map, FacesUV):
-                    for face in bm.faces:
-                        face_uv = uv_map.data[face.index]
-                        for loop, loop_uv_coords in zip(face.loops, face_uv):
-                            loop[uv_layer].uv = loop_uv_coords.tolist()
+                    # Faces corners are stored in the same order as the mesh loops
+                    loop_uv = np.ascontiguousarray(uv_map.data, dtype=np.float32).reshape(-1, 2)
+                    assert len(loop_uv) == len(loop_vertices), \
+                        f"Expected UV coordinates for {len(loop_vertices)} face corners, got {len(loop_uv)}"
                 else:
                     raise NotImplementedError(f"Unknown UV map type: {uv_map.__class__.__name__}")
-                bpy.ops.object.mode_set(mode='OBJECT')
+                uv_layer.data.foreach_set("uv", loop_uv.ravel())
             elif not isinstance(colors, UniformColors):
                 raise NotImplementedError(f"Unknown Colors type {colors.__class__.__name__}")
         super()._blender_set_colors(colors_list)
@@ -154,32 +143,22 @@ class Mesh(RenderableObject):
         """Updates mesh vertices coordinates
 
         Args:
-            vertices (np.ndarray): new vertex coordinates
+            vertices (np.ndarray): new vertex coordinates; C-contiguous float32 array is written to Blender as is,
+                other arrays are converted to float32 first
         """
         assert len(self._blender_mesh.vertices) == len(vertices), \
             f"Number of vertices should be the same (expected {len(self._blender_mesh.vertices)}, got {len(vertices)})"
-        for ind, vert in enumerate(self._blender_mesh.vertices):
-            vert.co = vertices[ind]
+        # Contiguous float32 buffer is copied by foreach_set directly, without per-vertex conversion
+        vertices = np.ascontiguousarray(vertices, dtype=np.float32)
+        self._blender_mesh.vertices.foreach_set("co", vertices.ravel())
         self._blender_mesh.update()
 
     def _blender_assign_materials(self):
         super()._blender_assign_materials()
-        assert self._faces_material is None or (len(self._faces_material) == self._faces_count), \
-            f"Number of material faces should be equal to the number of faces ({self._faces_count})"
-        if not (len(self._material_instances) == 1 or self._faces_material is None):
-            bpy.context.view_layer.objects.active = self._blender_object
-            bpy.ops.object.mode_set(mode='EDIT')
-            bpy.ops.mesh.select_mode(type='FACE')
-            bpy.ops.mesh.select_all(action='DESELECT')
-            bm = bmesh.from_edit_mesh(self._blender_mesh)
-            for mat_ind in range(self._materials_count):
-                for face in bm.faces:
-                    perface_mat_ind = self._faces_material[face.index]
-                    if perface_mat_ind == mat_ind:
-                        face.select = True
-                self._blender_object.active_material_index = mat_ind
-                bpy.ops.object.material_slot_assign()
-                bpy.ops.mesh.select_all(action='DESELECT')
-            # bmesh.update_edit_mesh(self._blender_object.data)
-            bpy.ops.object.mode_set(mode='OBJECT')
+        # Single material is already assigned to all the faces by the base class
+        if self._faces_material is None or len(self._material_instances) == 1:
+            return
+        # Material slot indices of all the faces are written with a single buffer copy, without Edit mode
+        self._blender_mesh.polygons.foreach_set("material_index", self._faces_material)
+        self._blender_mesh.update()
 
@@ -24,29 +24,28 @@ SOFTWARE.
 """
 import warnings
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Tuple
+from typing import List, Optional, Tuple
 
+import bmesh
 import bpy
 import numpy as np
-from mathutils import Vector
 
 from .base import Renderable
 from ..colors import VertexColors, UniformColors
 from ..colors.base import ColorsMetadata, Colors
-from ..internal.texture import compute_particle_color_texture
+from ..internal.texture import compute_particle_color_texture, update_particle_color_texture
+from ..internal.types import Vector4d
 from ..materials.base import Material, MaterialInstance
 
 
 @ dataclass
 class ParticleMetadata:
-    """Helper class that stores pointers to blender objects (colors, bsdf and material nodes),
-    connected to each Particle System object
+    """Helper class that stores pointers to blender objects, connected to each Particle System object
     """
-    material_instance: Optional[MaterialInstance]  # Material instance for the particle system
-    extra_color_nodes: Tuple[bpy.types.ShaderNode]  # Extra nodes in the material node tree necessary for proper color computation
     vertex_offset: int  # index of a starting vertex
     num_particles: int  # number of particles in particle collection
-    texture_image: Optional[bpy.types.Image]  # texture image for per-vertex colors
+    particle_obj: bpy.types.Object  # Blender object of the primitive instanced by the particle system
+    point_cloud_obj: bpy.types.Object  # Blender object with the particle system
 
 
 class PointCloud(Renderable):
@@ -108,8 +107,15 @@ class PointCloud(Renderable):
         self._particle_material_names: List[str] = list()
 
         self.num_vertices: int = 0
-        self._particle_metadata: Dict[str, ParticleMetadata] = dict()  # particle_object_name: ParticleMetadata
+        self._particle_metadata: List[ParticleMetadata] = list()  # ParticleMetadata for each subset, in vertex order
         self._colors_metadata: Optional[ColorsMetadata] = None
+        # Material, color nodes and texture are shared by all the particle systems
+        self._material_instance: Optional[MaterialInstance] = None
+        self._extra_color_nodes: Tuple[bpy.types.ShaderNode] = tuple()  # Extra nodes necessary for color computation
+        self._texture_image: Optional[bpy.types.Image] = None  # texture image for per-vertex colors
+        self._emit_shadow: Optional[bool] = None  # cached value, set on each write through the emit_shadow setter
+        # Buffer for converting subsets of vertices to float32 in update_vertices, reused across calls
+        self._subset_buffer: np.ndarray = np.empty((self._max_particles, 3), dtype=np.float32)
 
         collection = self._blender_create_collection(vertices, tag)
         super().__init__(**kwargs, blender_object=collection, tag=tag)
@@ -121,38 +127,53 @@ class PointCloud(Renderable):
         """Updates pc vertices coordinates
 
         Args:
-            vertices (np.ndarray): new coordinates for point cloud vertices
+            vertices (np.ndarray): new coordinates for point cloud vertices; C-contiguous float32 array is written
+                to Blender as is, other arrays are converted to float32 subset by subset
         """
         assert self.num_vertices == len(vertices), \
             f"Number of vertices should be the same (expected {self.num_vertices}, got {len(vertices)})"
-        for subset_ind, offset in enumerate(range(0, self.num_vertices, self._max_particles)):
-            points_subset = vertices[offset: offset + self._max_particles]
+        vertices = np.asarray(vertices)
+        # Contiguous float32 vertices are streamed as is, otherwise each subset is converted
+        # into the preallocated subset buffer
+        convert_subsets = vertices.dtype != np.float32 or not vertices.flags.c_contiguous
+        # Subset offsets are computed once on creation and stored in the metadata
+        for metadata in self._particle_metadata:
+            vertex_offset = metadata.vertex_offset
+            points_subset = vertices[vertex_offset: vertex_offset + metadata.num_particles]
+            if convert_subsets:
+                points_subset_buffer = self._subset_buffer[:metadata.num_particles]
+                np.copyto(points_subset_buffer, points_subset, casting="unsafe")
+                points_subset = points_subset_buffer
 
             # update PC object
-            pc_object = self._blender_object.all_objects[f"Particle_{subset_ind}_PC"]
-            for vert_ind, vert in enumerate(pc_object.vertices):
-                vert.co = points_subset[vert_ind]
-            pc_object.update()
+            point_cloud_mesh = metadata.point_cloud_obj.data
+            point_cloud_mesh.vertices.foreach_set("co", points_subset.ravel())
+            point_cloud_mesh.update()
 
     # Getter and setter for emit_shadow: this property may be turned off if the particle_emission_strength
     # is big enough to avoid artifacts.
     @property
     def emit_shadow(self):
+        if self._emit_shadow is not None:
+            return self._emit_shadow
         val = None
-        for particle_obj_name in self._particle_metadata.keys():
-            particle_obj = self._blender_object.all_objects[particle_obj_name]
-            curr_val = particle_obj.cycles_visibility.shadow
+        for metadata in self._particle_metadata:
+            curr_val = metadata.particle_obj.cycles_visibility.shadow
             if val is None:
                 val = curr_val
             elif val != curr_val:
                 return None
+        self._emit_shadow = val
         return val
 
     @emit_shadow.setter
     def emit_shadow(self, val: bool):
-        for particle_obj_name in self._particle_metadata.keys():
-            particle_obj = self._blender_object.all_objects[particle_obj_name]
-            particle_obj.cycles_visibility.shadow = val
+        # All particle objects already hold this value, avoid rewriting the property for each of them
+        if self._emit_shadow is not None and self._emit_shadow == val:
+            return
+        for metadata in self._particle_metadata:
+            metadata.particle_obj.cycles_visibility.shadow = val
+        self._emit_shadow = val
 
     # ===================================================== OBJECT =====================================================
     def _blender_create_collection(
@@ -174,35 +195,41 @@ class PointCloud(Renderable):
 
         self.point_cloud_obj_list = []
         self.num_vertices = len(vertices)
+        # Convert once, so that each subset is a contiguous float32 view
+        vertices = np.ascontiguousarray(vertices, dtype=np.float32)
+        # All particles are identical, so all particle objects share a single primitive mesh
+        particle_mesh = self._add_particle_mesh(
+            particle_mesh_name=f"Particle {tag}",
+            mesh_type=self._base_primitive,
+            point_size=self._point_size
+        )
         for index, vertex_start in enumerate(range(0, self.num_vertices, self._max_particles)):
-            # This name is used is a unique identifier for
-            # the internal dictionary with metadata self._particle_metadata
             particle_obj_name = f"Particle_{index}"
             # particle_material_name = f"Particle_{index}_Material"
             point_cloud_obj_name = f"Particle_{index}_PC"
 
             self._point_cloud_object_names.append(point_cloud_obj_name)
             points_subset = vertices[vertex_start: vertex_start + self._max_particles]
-            self._particle_metadata[particle_obj_name] = ParticleMetadata(
-                material_instance=None,
-                extra_color_nodes=tuple(),
-                vertex_offset=vertex_start,
-                num_particles=len(points_subset),
-                texture_image=None
-            )
-
             particle_obj = self._add_particle_obj(
                 particle_obj_name=particle_obj_name,
-                mesh_type=self._base_primitive,
-                point_size=self._point_size,
+                particle_mesh=particle_mesh,
                 blender_collection=new_collection
             )
+            # The shared material reads the row of the subset in the color texture from this custom property,
+            # the pass index of the object is left to the user
+            particle_obj["subset_index"] = index
             point_cloud_obj = self._add_particle_system_obj(
                 coords=points_subset,
                 particle_obj=particle_obj,
                 point_cloud_obj_name=point_cloud_obj_name,
                 blender_collection=new_collection,
             )
+            self._particle_metadata.append(ParticleMetadata(
+                vertex_offset=vertex_start,
+                num_particles=len(points_subset),
+                particle_obj=particle_obj,
+                point_cloud_obj=point_cloud_obj
+            ))
             self.point_cloud_obj_list.append(point_cloud_obj)
 
         return new_collection
@@ -215,43 +242,61 @@ class PointCloud(Renderable):
         super()._blender_remove_object()
 
     @staticmethod
-    def _add_particle_obj(
-            particle_obj_name: str,
+    def _add_particle_mesh(
+            particle_mesh_name: str,
             mesh_type: str,
-            point_size: float,
-            blender_collection: bpy.types.Collection
-    ) -> bpy.types.Object:
-        """Creates particle that will be used in particle system to represent vertices in the point cloud
+            point_size: float
+    ) -> bpy.types.Mesh:
+        """Creates mesh of the primitive that will be used in particle system to represent vertices in the point cloud.
+        The mesh is built with bmesh directly, which avoids the overhead of bpy.ops operators
 
         Args:
-            particle_obj_name (str): name of a Blender primitive object to be created
+            particle_mesh_name (str): name of a Blender mesh to be created
             mesh_type (str): type of primitive for representing each point (possible values are PLANE, CUBE, SPHERE)
             point_size (float): size of a primitive
-            blender_collection (bpy.types.Collection): a Blender collection for storing the primitive
 
         Returns:
-            bpy.types.Object: a Blender primitive that is used to represent point cloud vertex
+            bpy.types.Mesh: a Blender mesh of the primitive that is used to represent point cloud vertex
         """
         # The default size of elements added with
         #   primitive_cube_add, primitive_uv_sphere_add, etc. is (2,2,2)
         point_scale = point_size * 0.5
-        bpy.ops.object.select_all(action="DESELECT")
+        bm = bmesh.new()
+        # Parameters match the ones used by bpy.ops.mesh.primitive_*_add
         if mesh_type == "PLANE":
-            bpy.ops.mesh.primitive_plane_add(size=point_scale)
+            bmesh.ops.create_grid(bm, x_segments=1, y_segments=1, size=point_scale * 0.5)
         elif mesh_type == "CUBE":
-            bpy.ops.mesh.primitive_cube_add(size=point_scale)
-        elif mesh_type == "SPHERE":
-            bpy.ops.mesh.primitive_uv_sphere_add(radius=point_scale)
+            bmesh.ops.create_cube(bm, size=point_scale)
         else:
-            bpy.ops.mesh.primitive_uv_sphere_add(radius=point_scale)
-        particle_obj = bpy.context.object
-        bpy.context.view_layer.objects.active = particle_obj
-        bpy.ops.object.mode_set(mode='OBJECT')
-        # Purposely repeating object name setting 2 times - for some primitives (cubes) setting it just ones sometimes doesn't work
-        particle_obj.name = particle_obj_name
-        particle_obj.name = particle_obj_name
+            bmesh.ops.create_uvsphere(bm, u_segments=32, v_segments=16, radius=point_scale)
+        particle_mesh = bpy.data.meshes.new(particle_mesh_name)
+        bm.to_mesh(particle_mesh)
+        bm.free()
+        # Empty material slot, the material itself is linked to each particle object separately
+        particle_mesh.materials.append(None)
+
+        return particle_mesh
+
+    @staticmethod
+    def _add_particle_obj(
+            particle_obj_name: str,
+            particle_mesh: bpy.types.Mesh,
+            blender_collection: bpy.types.Collection
+    ) -> bpy.types.Object:
+        """Creates particle that will be used in particle system to represent vertices in the point cloud
+
+        Args:
+            particle_obj_name (str): name of a Blender primitive object to be created
+            particle_mesh (bpy.types.Mesh): mesh of the primitive, shared between all the particle objects
+            blender_collection (bpy.types.Collection): a Blender collection for storing the primitive
+
+        Returns:
+            bpy.types.Object: a Blender primitive that is used to represent point cloud vertex
+        """
+        particle_obj = bpy.data.objects.new(particle_obj_name, particle_mesh)
+        # The mesh is shared, so the material is assigned to the object instead of the mesh
+        particle_obj.material_slots[0].link = "OBJECT"
         blender_collection.objects.link(particle_obj)
-        bpy.context.collection.objects.unlink(particle_obj)
 
         return particle_obj
 
@@ -275,16 +320,15 @@ class PointCloud(Renderable):
             bpy.types.Object: Blender particle system object
         """
         point_cloud_mesh = bpy.data.meshes.new(point_cloud_obj_name)
+        # The mesh consists only of vertices, so there is nothing to validate
+        # foreach_set copies the buffer directly only for contiguous float32 data
+        coords = np.ascontiguousarray(coords, dtype=np.float32)
+        point_cloud_mesh.vertices.add(len(coords))
+        point_cloud_mesh.vertices.foreach_set("co", coords.ravel())
         point_cloud_mesh.update()
-        point_cloud_mesh.validate()
-        point_cloud_mesh.from_pydata(coords, [], [])
 
         point_cloud_obj = bpy.data.objects.new(point_cloud_obj_name, point_cloud_mesh)
         blender_collection.objects.link(point_cloud_obj)
-        point_cloud_obj.select_set(state=True)
-
-        if bpy.context.view_layer.objects.active is None or bpy.context.view_layer.objects.active.mode == "OBJECT":
-            bpy.context.view_layer.objects.active = point_cloud_obj
 
         if len(point_cloud_obj.particle_systems) == 0:
             point_cloud_obj.modifiers.new("particle sys", type="PARTICLE_SYSTEM")
@@ -329,12 +373,11 @@ class PointCloud(Renderable):
         Args:
             material (Material): target material
         """
-        for particle_obj_name, metadata in self._particle_metadata.items():
-            material_instance = material.create_material(name=f"{particle_obj_name}_Material")
-            blender_material = material_instance.blender_material
-            metadata.material_instance = material_instance
-            particle_obj = self._blender_object.all_objects[particle_obj_name]
-            particle_obj.data.materials.append(blender_material)
+        # All the subsets share a single material
+        self._material_instance = material._blender_create_instance(name=f"{self.tag}_Material")
+        blender_material = self._material_instance.blender_material
+        for metadata in self._particle_metadata:
+            metadata.particle_obj.material_slots[0].material = blender_material
 
         self._blender_create_colors_node()
         self._blender_link_color2material()
@@ -344,20 +387,16 @@ class PointCloud(Renderable):
     ):
         """Clears Blender material node and nodes connected to it
         """
-        for particle_obj_name, metadata in self._particle_metadata.items():
-            if metadata.material_instance is not None:
-                material_instance = metadata.material_instance
-                material_nodes = material_instance.blender_material.node_tree.nodes
-                blender_material = material_instance.blender_material
-                for material_node in material_nodes:
-                    blender_material.node_tree.nodes.remove(material_node)
-                particle_obj = self._blender_object.all_objects[particle_obj_name]
-                particle_obj.data.materials.clear()
-                blender_material.user_clear()
-                bpy.data.materials.remove(blender_material)
-
-                metadata.material_instance = None
-                metadata.extra_color_nodes = tuple()
+        if self._material_instance is not None:
+            # The nodes are freed together with the material, so they are not removed one by one
+            blender_material = self._material_instance.blender_material
+            for metadata in self._particle_metadata:
+                metadata.particle_obj.material_slots[0].material = None
+            blender_material.user_clear()
+            bpy.data.materials.remove(blender_material)
+
+            self._material_instance = None
+            self._extra_color_nodes = tuple()
 
     # ================================================ END OF MATERIAL =================================================
 
@@ -374,8 +413,13 @@ class PointCloud(Renderable):
         if not isinstance(colors, Colors):
             assert len(colors) == 1, "Only one color can be provided for the point cloud"
             colors = colors[0]
-        self._blender_clear_colors()
-        self._blender_set_colors(colors)
+        if self._colors_metadata is not None and self._colors_metadata.type is colors.metadata.type \
+                and self._colors_metadata.has_alpha == colors.metadata.has_alpha:
+            # The node graph stays the same, only the color values have to be updated
+            self._blender_update_colors(colors)
+        else:
+            self._blender_clear_colors()
+            self._blender_set_colors(colors)
 
     def _blender_set_colors(
             self,
@@ -390,124 +434,144 @@ class PointCloud(Renderable):
 
         # Create artificial textures if we have VertexColors
         if self._colors_metadata.type == VertexColors:
-            for particle_obj_name, metadata in self._particle_metadata.items():
-                vertex_offset = metadata.vertex_offset
-                vertex_colors_subset = colors.vertex_colors[vertex_offset: vertex_offset + self._max_particles]
-                metadata.texture_image = compute_particle_color_texture(vertex_colors_subset)
+            # A single texture is shared by all the subsets, each row stores colors of one subset
+            # (a cloud smaller than one subset gets a single row of its own size)
+            self._texture_image = compute_particle_color_texture(
+                colors.vertex_colors, width=min(self._max_particles, self.num_vertices)
+            )
 
         self._blender_create_colors_node()
         self._blender_link_color2material()
 
+    def _blender_update_colors(
+            self,
+            colors: Colors
+    ):
+        """Writes new color values to the already existing color nodes and textures without rebuilding the node graph.
+        Colors should be of the same type and have the same number of channels as the current ones
+
+        Args:
+            colors (Colors): target colors information
+        """
+        self._colors_metadata = colors.metadata
+        if self._colors_metadata.type is UniformColors:
+            color = self._blender_set_uniform_color()
+            material_instance = self._material_instance
+            if self._colors_metadata.has_alpha and 'Alpha' in material_instance.inputs:
+                material_instance.inputs['Alpha'].default_value = color[3]
+        elif self._colors_metadata.type is VertexColors:
+            assert len(colors.vertex_colors) == self.num_vertices, \
+                f"Number of colors should be the same as number of vertices " \
+                f"(expected {self.num_vertices}, got {len(colors.vertex_colors)})"
+            update_particle_color_texture(self._texture_image, colors.vertex_colors)
+            # The packed copy is not refreshed here, the changed image is re-packed on export
+            self._texture_image.update()
+        else:
+            raise NotImplementedError(f"Unsupported colors class '{self._colors_metadata.type}'")
+
+    def _blender_set_uniform_color(self) -> Vector4d:
+        """Writes the current uniform color to the color node of the material
+
+        Returns:
+            Vector4d: the color in RGBA format
+        """
+        color = self._colors_metadata.color
+        self._material_instance.colors_node.outputs[0].default_value = color
+        return color
+
     def _blender_clear_colors(
             self,
     ):
         """Clears Blender color node and erases node constructor
         """
-        for particle_obj_name, metadata in self._particle_metadata.items():
-            material_instance = metadata.material_instance
-            if material_instance.colors_node is not None:
-                blender_material = material_instance.blender_material
-                blender_material.node_tree.nodes.remove(material_instance.colors_node)
-                for extra_node in metadata.extra_color_nodes:
-                    blender_material.node_tree.nodes.remove(extra_node)
-
-                # Clear artificially created texture 
-                if metadata.texture_image is not None:
-                    # Remove only if the image has no users.
-                    if not metadata.texture_image.users:
-                        bpy.data.images.remove(metadata.texture_image)
-                material_instance.colors_node = None
-                metadata.extra_color_nodes = tuple()
-                metadata.texture_image = None
-                self._colors_metadata = None
+        material_instance = self._material_instance
+        if material_instance.colors_node is not None:
+            material_nodes = material_instance.blender_material.node_tree.nodes
+            for color_node in (material_instance.colors_node,) + self._extra_color_nodes:
+                material_nodes.remove(color_node)
+
+            # Clear artificially created texture
+            if self._texture_image is not None:
+                # Remove only if the image has no users.
+                if not self._texture_image.users:
+                    bpy.data.images.remove(self._texture_image)
+            material_instance.colors_node = None
+            self._extra_color_nodes = tuple()
+            self._texture_image = None
+            self._colors_metadata = None
 
     def _blender_create_colors_node(self):
         """Creates color node using previously set builder
         """
         if self._colors_metadata is not None:
-            for particle_obj_name, metadata in self._particle_metadata.items():
-                material_instance = metadata.material_instance
-                blender_material = material_instance.blender_material
-
-                if self._colors_metadata.type == UniformColors:
-                    colors_node = blender_material.node_tree.nodes.new('ShaderNodeRGB')
-                    colors_node.outputs[0].default_value = Vector(self._colors_metadata.color.tolist() + [1.]).to_4d()
-                    material_instance.colors_node = colors_node
-                elif self._colors_metadata.type == VertexColors:
-                    particle_color_node = blender_material.node_tree.nodes.new("ShaderNodeTexImage")
-                    particle_color_node.interpolation = "Closest"
-                    particle_color_node.image = metadata.texture_image
-                    particle_info_node = blender_material.node_tree.nodes.new("ShaderNodeParticleInfo")
-
-                    # Idea: we use the particle idx to compute a texture coordinate
-                    # Shift the un-normalized texture coordinate by a half pixel
-                    shift_half_pixel_node = blender_material.node_tree.nodes.new("ShaderNodeMath")
-                    shift_half_pixel_node.operation = "ADD"
-                    blender_material.node_tree.links.new(
-                        particle_info_node.outputs["Index"],
-                        shift_half_pixel_node.inputs[0],
-                    )
-                    shift_half_pixel_node.inputs[1].default_value = 0.5
-
-                    # Compute normalized texture coordinates (value between 0 and 1)
-                    # by dividing by the number of particles
-                    divide_node = blender_material.node_tree.nodes.new("ShaderNodeMath")
-                    divide_node.operation = "DIVIDE"
-                    blender_material.node_tree.links.new(
-                        shift_half_pixel_node.outputs["Value"],
-                        divide_node.inputs[0],
-                    )
-                    divide_node.inputs[1].default_value = metadata.num_particles
-
-                    # Compute texture coordinate (x axis corresponds to particle idx)
-                    shader_node_combine = blender_material.node_tree.nodes.new("ShaderNodeCombineXYZ")
-                    blender_material.node_tree.links.new(
-                        divide_node.outputs["Value"], shader_node_combine.inputs["X"]
-                    )
-                    blender_material.node_tree.links.new(
-                        shader_node_combine.outputs["Vector"],
-                        particle_color_node.inputs["Vector"],
-                    )
-                    material_instance.colors_node = particle_color_node
-                    metadata.extra_color_nodes = (particle_info_node, shift_half_pixel_node, divide_node, shader_node_combine)
-                else:
-                    raise NotImplementedError(f"Unsupported colors class '{self._colors_metadata.type}'")
+            material_instance = self._material_instance
+            node_tree = material_instance.blender_material.node_tree
+            new_node = node_tree.nodes.new
+            new_link = node_tree.links.new
+
+            if self._colors_metadata.type == UniformColors:
+                # A single RGB node in the shared material colors all the subsets
+                material_instance.colors_node = new_node('ShaderNodeRGB')
+                self._blender_set_uniform_color()
+            elif self._colors_metadata.type == VertexColors:
+                particle_color_node = new_node("ShaderNodeTexImage")
+                particle_color_node.interpolation = "Closest"
+                particle_color_node.image = self._texture_image
+                particle_info_node = new_node("ShaderNodeParticleInfo")
+                subset_index_node = new_node("ShaderNodeAttribute")
+                subset_index_node.attribute_type = "OBJECT"
+                subset_index_node.attribute_name = "subset_index"
+
+                # Idea: we use the particle idx (x axis) and the subset idx (y axis, custom property of the instanced
+                # particle) to compute a texture coordinate.
+                # Normalized texture coordinates (values between 0 and 1) of the pixel center are computed
+                # in a single vector node as (idx + 0.5) / size = idx * (1 / size) + 0.5 / size
+                shader_node_combine = new_node("ShaderNodeCombineXYZ")
+                new_link(particle_info_node.outputs["Index"], shader_node_combine.inputs["X"])
+                new_link(subset_index_node.outputs["Fac"], shader_node_combine.inputs["Y"])
+                texture_width, texture_height = self._texture_image.size
+                texcoord_node = new_node("ShaderNodeVectorMath")
+                texcoord_node.operation = "MULTIPLY_ADD"
+                new_link(shader_node_combine.outputs["Vector"], texcoord_node.inputs[0])
+                texcoord_node.inputs[1].default_value = (1. / texture_width, 1. / texture_height, 0.)
+                texcoord_node.inputs[2].default_value = (0.5 / texture_width, 0.5 / texture_height, 0.)
+                new_link(texcoord_node.outputs["Vector"], particle_color_node.inputs["Vector"])
+                material_instance.colors_node = particle_color_node
+                self._extra_color_nodes = (particle_info_node, subset_index_node, shader_node_combine, texcoord_node)
+            else:
+                raise NotImplementedError(f"Unsupported colors class '{self._colors_metadata.type}'")
 
     def _blender_link_color2material(
             self
     ):
         """Links color and material nodes, additionally adds emission to particle color if needed
         """
-        for particle_obj_name, metadata in self._particle_metadata.items():
-            material_instance = metadata.material_instance
-            if material_instance is not None:
-                colors_node = material_instance.colors_node
-
-                if colors_node is not None:
-                    blender_material = material_instance.blender_material
-                    colors_metadata = self._colors_metadata
-                    blender_material.node_tree.links.new(material_instance.inputs['Color'],
-                                                         material_instance.colors_node.outputs['Color'])
-                    material_instance.inputs['Color'].default_value = [1.0, 0.0, 0.0, 1.0]
-
-                    if colors_metadata.has_alpha:
-                        if 'Alpha' in material_instance.inputs:
-                            if colors_metadata.type is UniformColors:
-                                material_instance.inputs['Alpha'].default_value = colors_metadata.color[3]
-                            else:
-                                blender_material.node_tree.links.new(material_instance.inputs['Alpha'],
-                                                                     material_instance.colors_node.outputs['Alpha'])
-                        else:
-                            warnings.warn("This material does not support transparency; alpha color channel is ignored")
-
-                    if self.particle_emission_strength > 0:
-                        if 'Emission' in material_instance.inputs:
-                            blender_material.node_tree.links.new(
-                                colors_node.outputs["Color"],
-                                material_instance.inputs["Emission"],
-                            )
-                            material_instance.inputs["Emission Strength"].default_value = self.particle_emission_strength
+        material_instance = self._material_instance
+        if material_instance is not None:
+            colors_node = material_instance.colors_node
+
+            if colors_node is not None:
+                # The material is shared by all the subsets, so each input is resolved only once
+                material_inputs = material_instance.inputs
+                new_link = material_instance.blender_material.node_tree.links.new
+                colors_metadata = self._colors_metadata
+                new_link(material_inputs['Color'], colors_node.outputs['Color'])
+                material_inputs['Color'].default_value = [1.0, 0.0, 0.0, 1.0]
+
+                if colors_metadata.has_alpha:
+                    if 'Alpha' in material_inputs:
+                        if colors_metadata.type is UniformColors:
+                            material_inputs['Alpha'].default_value = colors_metadata.color[3]
                         else:
-                            warnings.warn("This material does not support light emission; emission is ignored")
+                            new_link(material_inputs['Alpha'], colors_node.outputs['Alpha'])
+                    else:
+                        warnings.warn("This material does not support transparency; alpha color channel is ignored")
+
+                if self.particle_emission_strength > 0:
+                    if 'Emission' in material_inputs:
+                        new_link(colors_node.outputs["Color"], material_inputs["Emission"])
+                        material_inputs["Emission Strength"].default_value = self.particle_emission_strength
+                    else:
+                        warnings.warn("This material does not support light emission; emission is ignored")
 
     # ================================================== END OF COLORS =================================================
@@ -1,3 +1,4 @@
+import math
 from abc import abstractmethod
 from typing import Sequence, Union
 
@@ -11,6 +12,26 @@ from ..colors.base import ColorsList, Colors
 from ..internal.types import Vector3d
 from ..materials.base import Material, MaterialList
 
+# Operator that is still used to create primitives, resolved once instead of on every construction
+_nurbs_sphere_add = bpy.ops.surface.primitive_nurbs_surface_sphere_add
+# Sharp edge threshold for mesh primitives, equals to the default split angle of the EDGE_SPLIT modifier
+_AUTO_SMOOTH_ANGLE = math.radians(30)
+
+
+def _blender_link_object(obj: bpy.types.Object):
+    """Links the object created from a datablock to the scene and makes it the only selected and the active object,
+    same as the bpy.ops primitive_*_add operators do
+
+    Args:
+        obj (bpy.types.Object): object to add to the scene
+    """
+    context = bpy.context
+    context.collection.objects.link(obj)
+    for selected_obj in context.selected_objects:
+        selected_obj.select_set(False)
+    obj.select_set(True)
+    context.view_layer.objects.active = obj
+
 
 # =================================================== Mesh Primitives ==================================================
 class MeshPrimitive(RenderableObject):
@@ -49,10 +70,54 @@ class MeshPrimitive(RenderableObject):
             translation (Vector3d, optional): translation applied to the Blender object (default: (0,0,0))
             tag (str): name of the created object in Blender
         """
+        # Stored as int32 array, so that it can be passed to foreach_set without conversion
+        if faces_material is not None:
+            faces_material = np.ascontiguousarray(faces_material, dtype=np.int32)
+        # The mesh is created by the child class, so the face count can be checked before the materials are set
+        assert faces_material is None or (len(faces_material) == len(self._blender_mesh.polygons)), \
+            f"Number of material faces should be equal to the number of faces ({len(self._blender_mesh.polygons)})"
         self._faces_material = faces_material
         super().__init__(**kwargs)
 
 
+    @staticmethod
+    def _blender_create_bmesh_object(
+        bm: bmesh.types.BMesh,
+        tag: str
+    ) -> bpy.types.Object:
+        """Creates Blender Object from the primitive geometry built with bmesh and adds it to the scene.
+        Results in the same state as bpy.ops.mesh.primitive_*_add operators, but avoids the operator overhead
+
+        Args:
+            bm (bmesh.types.BMesh): geometry of the primitive, freed after the mesh is created
+            tag (str): name of the created object in Blender
+
+        Returns:
+            bpy.types.Object: created object, which is the only selected and the active object
+        """
+        mesh = bpy.data.meshes.new(tag)
+        bm.to_mesh(mesh)
+        bm.free()
+        # Smooth shading (can be turned off with set_smooth) with split sharp edges,
+        # auto smooth gives the same result as the default EDGE_SPLIT modifier without evaluating a modifier
+        mesh.use_auto_smooth = True
+        mesh.auto_smooth_angle = _AUTO_SMOOTH_ANGLE
+        MeshPrimitive._blender_set_smooth(mesh, True)
+        obj = bpy.data.objects.new(tag, mesh)
+        _blender_link_object(obj)
+        return obj
+
+    @staticmethod
+    def _bmesh_new() -> bmesh.types.BMesh:
+        """Creates an empty bmesh with the UV layer, which is filled by bmesh.ops.create_* with calc_uvs=True
+
+        Returns:
+            bmesh.types.BMesh: empty bmesh
+        """
+        bm = bmesh.new()
+        bm.loops.layers.uv.new("UVMap")
+        return bm
+
     def _blender_set_colors(self, colors: Union[Colors, ColorsList]):
         colors_list = [colors] if isinstance(colors, Colors) else colors
         if not all(isinstance(x, UniformColors) for x in colors_list):
@@ -66,33 +131,31 @@ class MeshPrimitive(RenderableObject):
         Args:
             smooth (bool): Whether to turn the smooth surface on or off
         """
-        bpy.context.view_layer.objects.active = self._blender_object
-        bpy.ops.object.mode_set(mode='OBJECT')
-        if smooth:
-            bpy.ops.object.shade_smooth()
-        else:
-            bpy.ops.object.shade_flat()
+        self._blender_set_smooth(self._blender_mesh, smooth)
+
+    @staticmethod
+    def _blender_set_smooth(
+        mesh: bpy.types.Mesh,
+        smooth: bool
+    ):
+        """Writes the smooth shading flag to all the faces of the mesh
+
+        Args:
+            mesh (bpy.types.Mesh): mesh of the primitive
+            smooth (bool): Whether to turn the smooth surface on or off
+        """
+        polygons = mesh.polygons
+        polygons.foreach_set("use_smooth", np.full(len(polygons), smooth, dtype=bool))
+        mesh.update()
 
     def _blender_assign_materials(self):
         super()._blender_assign_materials()
-        if not (len(self._material_instances) == 1 or self._faces_material is None):
-            bpy.context.view_layer.objects.active = self._blender_object
-            bpy.ops.object.mode_set(mode='EDIT')
-            bpy.ops.mesh.select_mode(type="FACE")
-            bpy.ops.mesh.select_all(action='DESELECT')
-            bm = bmesh.from_edit_mesh(self._blender_mesh)
-            assert self._faces_material is None or (len(self._faces_material) == len(bm.faces)), \
-                f"Number of material faces should be equal to the number of faces ({len(bm.faces)})"
-            for mat_ind in range(self._materials_count):
-                for face in bm.faces:
-                    perface_mat_ind = self._faces_material[face.index]
-                    if perface_mat_ind == mat_ind:
-                        face.select = True
-                self._blender_object.active_material_index = mat_ind
-                bpy.ops.object.material_slot_assign()
-                bpy.ops.mesh.select_all(action='DESELECT')
-            # bmesh.update_edit_mesh(self._blender_object.data)
-            bpy.ops.object.mode_set(mode='OBJECT')
+        # Single material is already assigned to all the faces by the base class
+        if self._faces_material is None or len(self._material_instances) == 1:
+            return
+        # Material slot indices of all the faces are written with a single buffer copy
+        self._blender_mesh.polygons.foreach_set("material_index", self._faces_material)
+        self._blender_mesh.update()
 
 
 class CubeMesh(MeshPrimitive):
@@ -142,25 +205,9 @@ class CubeMesh(MeshPrimitive):
         size: float,
         tag: str
     ):
-        bpy.ops.mesh.primitive_cube_add(size=size)
-        obj = bpy.context.object
-        obj.name = tag
-        return obj
-
-    def _blender_set_colors(
-        self,
-        colors_list: ColorsList
-    ):
-        """Remembers current color properties, builds a color node for material, sets color information to mesh
-
-        Args:
-            colors_list (ColorsList): list of target colors
-        """
-        bpy.context.view_layer.objects.active = self._blender_object
-        bpy.ops.object.shade_smooth()
-        # bpy.context.space_data.context = 'MODIFIER'
-        bpy.ops.object.modifier_add(type='EDGE_SPLIT')
-        super()._blender_set_colors(colors_list)
+        bm = self._bmesh_new()
+        bmesh.ops.create_cube(bm, size=size, calc_uvs=True)
+        return self._blender_create_bmesh_object(bm, tag)
 
 
 class CircleMesh(MeshPrimitive):
@@ -216,25 +263,12 @@ class CircleMesh(MeshPrimitive):
         fill_type: str,
         tag: str
     ):
-        bpy.ops.mesh.primitive_circle_add(vertices=num_vertices, radius=radius, fill_type=fill_type)
-        obj = bpy.context.object
-        obj.name = tag
-        return obj
-
-    def _blender_set_colors(
-        self,
-        colors_list: Colors
-    ):
-        """Remembers current color properties, builds a color node for material, sets color information to mesh
-
-        Args:
-            colors_list (ColorsList): list of target colors
-        """
-        bpy.context.view_layer.objects.active = self._blender_object
-        bpy.ops.object.shade_smooth()
-        # bpy.context.space_data.context = 'MODIFIER'
-        bpy.ops.object.modifier_add(type='EDGE_SPLIT')
-        super()._blender_set_colors(colors_list)
+        bm = self._bmesh_new()
+        bmesh.ops.create_circle(
+            bm, segments=num_vertices, radius=radius,
+            cap_ends=fill_type != "NOTHING", cap_tris=fill_type == "TRIFAN", calc_uvs=True
+        )
+        return self._blender_create_bmesh_object(bm, tag)
 
 
 class CylinderMesh(MeshPrimitive):
@@ -294,25 +328,12 @@ class CylinderMesh(MeshPrimitive):
         fill_type: str,
         tag: str
     ):
-        bpy.ops.mesh.primitive_cylinder_add(vertices=num_vertices, radius=radius, depth=height, end_fill_type=fill_type)
-        obj = bpy.context.object
-        obj.name = tag
-        return obj
-
-    def _blender_set_colors(
-            self,
-            colors_list: ColorsList
-    ):
-        """Remembers current color properties, builds a color node for material, sets color information to mesh
-
-        Args:
-            colors_list (ColorsList): list of target colors
-        """
-        bpy.context.view_layer.objects.active = self._blender_object
-        bpy.ops.object.shade_smooth()
-        # bpy.context.space_data.context = 'MODIFIER'
-        bpy.ops.object.modifier_add(type='EDGE_SPLIT')
-        super()._blender_set_colors(colors_list)
+        bm = self._bmesh_new()
+        bmesh.ops.create_cone(
+            bm, segments=num_vertices, radius1=radius, radius2=radius, depth=height,
+            cap_ends=fill_type != "NOTHING", cap_tris=fill_type == "TRIFAN", calc_uvs=True
+        )
+        return self._blender_create_bmesh_object(bm, tag)
 
 
 class PlaneMesh(MeshPrimitive):
@@ -326,7 +347,6 @@ class PlaneMesh(MeshPrimitive):
     Methods:
         set_smooth(bool): turns smooth shading on and off based on the bool argument.
     """
-
     def __init__(
             self,
             size: float,
@@ -368,9 +388,10 @@ class PlaneMesh(MeshPrimitive):
             tag: str,
             shadow_catcher: bool
     ):
-        bpy.ops.mesh.primitive_plane_add(size=size)
-        obj = bpy.context.object
-        obj.name = tag
+        bm = self._bmesh_new()
+        # Grid size is the half of the plane side, as in bpy.ops.mesh.primitive_plane_add
+        bmesh.ops.create_grid(bm, x_segments=1, y_segments=1, size=size / 2, calc_uvs=True)
+        obj = self._blender_create_bmesh_object(bm, tag)
 
         if shadow_catcher:
             obj.is_shadow_catcher = True
@@ -380,21 +401,6 @@ class PlaneMesh(MeshPrimitive):
             obj.visible_volume_scatter = False
 
         return obj
-
-    def _blender_set_colors(
-            self,
-            colors_list: ColorsList
-    ):
-        """Remembers current color properties, builds a color node for material, sets color information to mesh
-
-        Args:
-            colors_list (ColorsList): list of target colors
-        """
-        bpy.context.view_layer.objects.active = self._blender_object
-        bpy.ops.object.shade_smooth()
-        # bpy.context.space_data.context = 'MODIFIER'
-        bpy.ops.object.modifier_add(type='EDGE_SPLIT')
-        super()._blender_set_colors(colors_list)
 # =============================================== End of Mesh Primitives ===============================================
 
 
@@ -406,7 +412,6 @@ class ParametricPrimitive(RenderableObject):
     Properties:
         emit_shadow (bool, optional): control whether the object will emit shadow from any light source in the scene.
     """
-
     @abstractmethod
     def __init__(
         self,
@@ -444,7 +449,7 @@ class ParametricPrimitive(RenderableObject):
         super()._blender_set_materials(material_list)
 
     def _blender_set_colors(self, colors_list: ColorsList):
-        if  not len(colors_list) == 1 or not isinstance(colors_list[0], UniformColors):
+        if not len(colors_list) == 1 or not isinstance(colors_list[0], UniformColors):
             raise NotImplementedError("Multiple materials, non-uniform colors or textures are not supported "
                                       "in parametric primitives, consider creating a primitive through Mesh for that")
         super()._blender_set_colors(colors_list)
@@ -495,9 +500,13 @@ class EllipsoidNURBS(ParametricPrimitive):
             radius: Vector3d,
             tag: str
     ):
-        bpy.ops.surface.primitive_nurbs_surface_sphere_add(radius=radius[0])
+        _nurbs_sphere_add(radius=radius[0])
         obj = bpy.context.object
-        obj.scale = (np.array(radius) / radius[0]).tolist()
+        # The sphere is created with the radius along the x axis, the other axes are rescaled relative to it
+        # (not needed for spheres, as the object is created with unit scale)
+        r0, r1, r2 = radius[0], radius[1], radius[2]
+        if r1 != r0 or r2 != r0:
+            obj.scale = (1., r1 / r0, r2 / r0)
         obj.name = tag
         return obj
 
@@ -577,24 +586,32 @@ class CurveBezier(ParametricPrimitive):
             translation (Vector3d, optional): translation applied to the Blender object (default: (0,0,0))
             tag (str): name of the created object in Blender
         """
+        # Cast and flatten the keypoints in a single pass before any Blender object is created
+        keypoints = np.ascontiguousarray(keypoints, dtype=np.float32)
+        assert keypoints.ndim == 2 and keypoints.shape[1] == 3, \
+            f"Expected keypoints array of shape (N,3) got shape {keypoints.shape}"
+        assert len(keypoints) >= 2, "Bezier curve should have at least two keypoints"
         obj = self._blender_create_object(tag)
         obj.data.bevel_depth = radius
         obj.data.bevel_resolution = 4
-        if len(keypoints) > 2:
-            obj.data.splines[0].bezier_points.add(count=len(keypoints) - 2)
-        for ind, coords in enumerate(keypoints):
-            obj.data.splines[0].bezier_points[ind].co = coords
-            obj.data.splines[0].bezier_points[ind].handle_left_type = 'VECTOR'
-            obj.data.splines[0].bezier_points[ind].handle_right_type = 'VECTOR'
+        # A new spline already has a single point
+        bezier_points = obj.data.splines.new('BEZIER').bezier_points
+        bezier_points.add(count=len(keypoints) - 1)
+        # Coordinates of all the points are written with a single buffer copy
+        bezier_points.foreach_set("co", keypoints.ravel())
+        for bezier_point in bezier_points:
+            bezier_point.handle_left_type = 'VECTOR'
+            bezier_point.handle_right_type = 'VECTOR'
         super().__init__(**kwargs, blender_object=obj, tag=tag)
 
     def _blender_create_object(
         self,
         tag: str
     ):
-        bpy.ops.curve.primitive_bezier_curve_add()
-        obj = bpy.context.object
-        obj.data.dimensions = '3D'
-        obj.data.fill_mode = 'FULL'
+        curve = bpy.data.curves.new(tag, type='CURVE')
+        curve.dimensions = '3D'
+        curve.fill_mode = 'FULL'
+        obj = bpy.data.objects.new(tag, curve)
+        _blender_link_object(obj)
         return obj
 # ============================================ End of Parametric Primitives ============================================
@@ -5,7 +5,7 @@ import tempfile
 import warnings
 from contextlib import nullcontext
 from pathlib import Path
-from typing import Union, Sequence
+from typing import Union, Sequence, Tuple, Optional
 
 import bpy
 import numpy as np
@@ -29,35 +29,36 @@ class Scene(metaclass=Singleton):
         self.renderables = RenderablesCollection()
         self.lights = LightsCollection()
         self._camera = None
+        self._gpu_rendering_mode = None
+        self._compositor = None
         self._reset_scene()
 
     @staticmethod
     def _set_default_blender_parameters():
         # Setup scene parameters
+        # (the scene, which is the only one after the reset, and its settings are resolved once)
         scene = bpy.data.scenes[0]
+        render = scene.render
         scene.use_nodes = True
-        bpy.context.scene.world.use_nodes = False
-        bpy.context.scene.render.engine = 'CYCLES'
-        bpy.context.scene.render.image_settings.color_mode = 'RGBA'
-        bpy.context.scene.render.image_settings.file_format = 'PNG'
-        bpy.context.scene.render.image_settings.quality = 100
-        bpy.context.scene.world.color = (0, 0, 0)
-        bpy.context.scene.render.film_transparent = True
-        bpy.context.scene.cycles.filter_width = 0  # turn off anti-aliasing
+        scene.world.use_nodes = False
+        render.engine = 'CYCLES'
+        render.image_settings.color_mode = 'RGBA'
+        render.image_settings.file_format = 'PNG'
+        render.image_settings.quality = 100
+        scene.world.color = (0, 0, 0)
+        render.film_transparent = True
+        scene.cycles.filter_width = 0  # turn off anti-aliasing
         # Important if you want to get a pure color background (eg. white background)
-        bpy.context.scene.view_settings.view_transform = 'Standard'
-        bpy.context.scene.cycles.samples = 128  # Default value, can be changed in .render
-        bpy.context.scene.frame_current = 0
+        scene.view_settings.view_transform = 'Standard'
+        scene.cycles.samples = 128  # Default value, can be changed in .render
+        scene.frame_current = 0
 
     @staticmethod
     def _remove_all_objects():
         """Removes all objects from the scene. Previously used to remove the default cube"""
-        bpy.ops.object.mode_set(mode='OBJECT')
-        bpy.ops.object.select_all(action='SELECT')
-        bpy.ops.object.delete(use_global=False)
-        bpy.ops.outliner.orphans_purge()
-        bpy.ops.outliner.orphans_purge()
-        bpy.ops.outliner.orphans_purge()
+        for obj in list(bpy.data.objects):
+            bpy.data.objects.remove(obj, do_unlink=True)
+        bpy.ops.outliner.orphans_purge(do_recursive=True)
 
     @staticmethod
     def _load_empty_scene():
@@ -76,6 +77,7 @@ class Scene(metaclass=Singleton):
         self.renderables._reset()
         self.lights._reset()
         self._camera = None
+        self._compositor = None
 
     def clear(self):
         """Clears the scene"""
@@ -205,6 +207,86 @@ class Scene(metaclass=Singleton):
         """
         return cv2.cvtColor(cv2.imread(path, cv2.IMREAD_UNCHANGED), cv2.COLOR_BGRA2RGBA)
 
+    def _setup_gpu_rendering_mode(self):
+        """Detects the appropriate GPU rendering mode and sets it in Cycles preferences.
+        Devices are only enumerated on the first call, as they do not change during the session
+        (the preferences are not affected by resetting the scene)
+        """
+        if self._gpu_rendering_mode is not None:
+            return
+        rendering_mode_priority_list = ['OPTIX', 'HIP', 'ONEAPI', 'CUDA']
+        rendering_preferences = bpy.context.preferences.addons['cycles'].preferences
+        rendering_preferences.refresh_devices()
+        devices = rendering_preferences.devices
+        available_rendering_modes = set()
+        for dev in devices:
+            available_rendering_modes.add(dev.type)
+        chosen_rendering_mode = "NONE"
+        for mode in rendering_mode_priority_list:
+            if mode in available_rendering_modes:
+                chosen_rendering_mode = mode
+                break
+
+        # Set GPU rendering mode to detected one
+        rendering_preferences.compute_device_type = chosen_rendering_mode
+        self._gpu_rendering_mode = chosen_rendering_mode
+
+        # Optionally, list the devices before rendering
+        # for dev in devices:
+        #     print(f"ID:{dev.id} Name:{dev.name} Type:{dev.type} Use:{dev.use}")
+
+    def _blender_setup_compositor(
+            self, use_shadow_catcher: bool, save_depth: bool, save_albedo: bool
+    ) -> Tuple[bpy.types.CompositorNodeOutputFile, Optional[bpy.types.CompositorNodeOutputFile],
+               Optional[bpy.types.CompositorNodeOutputFile]]:
+        """Builds the compositor node graph that writes the rendered passes to files.
+        The graph is only rebuilt when the set of outputs changes, otherwise the existing output nodes are reused
+
+        Args:
+            use_shadow_catcher (bool): whether to composite the shadow catcher pass over the image
+            save_depth (bool): whether to add the output node for the depth pass
+            save_albedo (bool): whether to add the output node for the albedo pass
+
+        Returns:
+            Tuple[bpy.types.CompositorNodeOutputFile, Optional[bpy.types.CompositorNodeOutputFile],
+                Optional[bpy.types.CompositorNodeOutputFile]]: output nodes for image, depth (or None)
+                and albedo (or None)
+        """
+        outputs_key = (use_shadow_catcher, save_depth, save_albedo)
+        if self._compositor is not None and self._compositor[0] == outputs_key:
+            return self._compositor[1]
+
+        scene_node_tree = bpy.context.scene.node_tree
+        scene_node_tree.nodes.clear()
+        render_layer = scene_node_tree.nodes.new(type="CompositorNodeRLayers")
+
+        # create output node
+        if use_shadow_catcher:
+            alpha_over = scene_node_tree.nodes.new(type="CompositorNodeAlphaOver")
+            scene_node_tree.links.new(render_layer.outputs['Shadow Catcher'], alpha_over.inputs[1])
+            scene_node_tree.links.new(render_layer.outputs['Image'], alpha_over.inputs[2])
+
+            output_image = scene_node_tree.nodes.new(type="CompositorNodeOutputFile")
+            scene_node_tree.links.new(alpha_over.outputs['Image'], output_image.inputs['Image'])
+        else:
+            output_image = scene_node_tree.nodes.new(type="CompositorNodeOutputFile")
+            scene_node_tree.links.new(render_layer.outputs['Image'], output_image.inputs['Image'])
+
+        output_depth = None
+        if save_depth:
+            output_depth = scene_node_tree.nodes.new(type="CompositorNodeOutputFile")
+            output_depth.format.file_format = "OPEN_EXR"
+            scene_node_tree.links.new(render_layer.outputs['Depth'], output_depth.inputs['Image'])
+
+        output_albedo = None
+        if save_albedo:
+            output_albedo = scene_node_tree.nodes.new(type="CompositorNodeOutputFile")
+            scene_node_tree.links.new(render_layer.outputs['DiffCol'], output_albedo.inputs['Image'])
+
+        outputs = (output_image, output_depth, output_albedo)
+        self._compositor = (outputs_key, outputs)
+        return outputs
+
     def render(
             self, filepath: Union[str, Path] = None, use_gpu: bool = True, samples: int = 128,
             save_depth: bool = False, save_albedo: bool = False, verbose: bool = False,
@@ -276,11 +358,6 @@ class Scene(metaclass=Singleton):
             bpy.context.scene.view_layers['ViewLayer'].use_pass_combined = True
             bpy.context.scene.view_layers['ViewLayer'].use_pass_diffuse_color = True
             bpy.context.scene.view_layers['ViewLayer'].use_pass_z = True
-            scene_node_tree = bpy.context.scene.node_tree
-
-            for n in scene_node_tree.nodes:
-                scene_node_tree.nodes.remove(n)
-            render_layer = scene_node_tree.nodes.new(type="CompositorNodeRLayers")
 
             # check if we have shadow catchers
             use_shadow_catcher = False
@@ -288,56 +365,15 @@ class Scene(metaclass=Singleton):
                 if obj.type != "LIGHT" and obj.is_shadow_catcher:
                     use_shadow_catcher = True
                     break
+            bpy.context.view_layer.cycles.use_pass_shadow_catcher = use_shadow_catcher
 
-            # create output node
-            if use_shadow_catcher:
-                bpy.context.view_layer.cycles.use_pass_shadow_catcher = True
-                alpha_over = scene_node_tree.nodes.new(type="CompositorNodeAlphaOver")
-                scene_node_tree.links.new(render_layer.outputs['Shadow Catcher'], alpha_over.inputs[1])
-                scene_node_tree.links.new(render_layer.outputs['Image'], alpha_over.inputs[2])
-
-                output_image = scene_node_tree.nodes.new(type="CompositorNodeOutputFile")
-                scene_node_tree.links.new(alpha_over.outputs['Image'], output_image.inputs['Image'])
-            else:
-                bpy.context.view_layer.cycles.use_pass_shadow_catcher = False
-                output_image = scene_node_tree.nodes.new(type="CompositorNodeOutputFile")
-                scene_node_tree.links.new(render_layer.outputs['Image'], output_image.inputs['Image'])
-
-            if save_depth:
-                output_depth = scene_node_tree.nodes.new(type="CompositorNodeOutputFile")
-                output_depth.format.file_format = "OPEN_EXR"
-                scene_node_tree.links.new(render_layer.outputs['Depth'], output_depth.inputs['Image'])
-
-            if save_albedo:
-                output_albedo = scene_node_tree.nodes.new(type="CompositorNodeOutputFile")
-                scene_node_tree.links.new(render_layer.outputs['DiffCol'], output_albedo.inputs['Image'])
+            output_image, output_depth, output_albedo = self._blender_setup_compositor(
+                use_shadow_catcher, save_depth, save_albedo
+            )
 
             if use_gpu:
-                bpy.context.scene.cycles.device = 'GPU'
-
-                for scene in bpy.data.scenes:
-                    scene.cycles.device = 'GPU'
-
-                # Detect the appropriate GPU rendering mode
-                rendering_mode_priority_list = ['OPTIX', 'HIP', 'ONEAPI', 'CUDA']
-                rendering_preferences = bpy.context.preferences.addons['cycles'].preferences
-                rendering_preferences.refresh_devices()
-                devices = rendering_preferences.devices
-                available_rendering_modes = set()
-                for dev in devices:
-                    available_rendering_modes.add(dev.type)
-                chosen_rendering_mode = "NONE"
-                for mode in rendering_mode_priority_list:
-                    if mode in available_rendering_modes:
-                        chosen_rendering_mode = mode
-                        break
-
-                # Set GPU rendering mode to detected one
-                rendering_preferences.compute_device_type = chosen_rendering_mode
-
-                # Optionally, list the devices before rendering
-                # for dev in devices:
-                #     print(f"ID:{dev.id} Name:{dev.name} Type:{dev.type} Use:{dev.use}")
+                scene.cycles.device = 'GPU'
+                self._setup_gpu_rendering_mode()
 
             # Render
             bpy.context.scene.frame_current = self._frame_number
@@ -352,11 +388,14 @@ class Scene(metaclass=Singleton):
                 temp_filesuffix = next(tempfile._get_candidate_names())
                 temp_filepath = str(filepath) + "." + temp_filesuffix
             temp_filename = os.path.basename(temp_filepath)
+            # Output nodes can be reused from the previous render, so the base paths are always set explicitly
             output_image.base_path = basepath
             output_image.file_slots[0].path = temp_filename + ".color."
             if save_depth:
+                output_depth.base_path = basepath
                 output_depth.file_slots[0].path = temp_filename + ".depth."
             if save_albedo:
+                output_albedo.base_path = basepath
                 output_albedo.file_slots[0].path = temp_filename + ".albedo."
 
             with catch_stdout(skip=verbose):
@@ -440,22 +479,7 @@ class Scene(metaclass=Singleton):
             bpy.context.scene.view_layers['ViewLayer'].use_pass_combined = True
             bpy.context.scene.view_layers['ViewLayer'].use_pass_diffuse_color = True
             bpy.context.scene.view_layers['ViewLayer'].use_pass_z = True
-            scene_node_tree = bpy.context.scene.node_tree
-
-            for n in scene_node_tree.nodes:
-                scene_node_tree.nodes.remove(n)
-            render_layer = scene_node_tree.nodes.new(type="CompositorNodeRLayers")
-            output_image = scene_node_tree.nodes.new(type="CompositorNodeOutputFile")
-            scene_node_tree.links.new(render_layer.outputs['Image'], output_image.inputs['Image'])
-
-            if save_depth:
-                output_depth = scene_node_tree.nodes.new(type="CompositorNodeOutputFile")
-                output_depth.format.file_format = "OPEN_EXR"
-                scene_node_tree.links.new(render_layer.outputs['Depth'], output_depth.inputs['Image'])
-
-            if save_albedo:
-                output_albedo = scene_node_tree.nodes.new(type="CompositorNodeOutputFile")
-                scene_node_tree.links.new(render_layer.outputs['DiffCol'], output_albedo.inputs['Image'])
+            output_image, output_depth, output_albedo = self._blender_setup_compositor(False, save_depth, save_albedo)
 
             # Render
             bpy.context.scene.frame_current = self._frame_number
@@ -470,11 +494,14 @@ class Scene(metaclass=Singleton):
                 temp_filesuffix = next(tempfile._get_candidate_names())
                 temp_filepath = str(filepath) + "." + temp_filesuffix
             temp_filename = os.path.basename(temp_filepath)
+            # Output nodes can be reused from the previous render, so the base paths are always set explicitly
             output_image.base_path = basepath
             output_image.file_slots[0].path = temp_filename + ".color."
             if save_depth:
+                output_depth.base_path = basepath
                 output_depth.file_slots[0].path = temp_filename + ".depth."
             if save_albedo:
+                output_albedo.base_path = basepath
                 output_albedo.file_slots[0].path = temp_filename + ".albedo."
 
             with catch_stdout(skip=verbose):
@@ -544,6 +571,11 @@ class Scene(metaclass=Singleton):
         Path(path).parent.mkdir(parents=True, exist_ok=True)
 
         with catch_stdout(skip=verbose):
+            # Generated textures (e.g. point cloud colors) are updated in memory without re-packing,
+            # so the packed data is refreshed here for the ones that changed since they were packed
+            for image in bpy.data.images:
+                if image.packed_file is not None and image.is_dirty:
+                    image.pack()
             if include_file_textures:
                 bpy.ops.file.pack_all()
             bpy.ops.wm.save_as_mainfile(filepath=path)
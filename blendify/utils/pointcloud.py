@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Union, Optional
 
 import numpy as np
 import trimesh
@@ -13,6 +13,11 @@ from skimage.io import imsave
 
 from ..internal.types import Vector3d, Vector4d
 
+try:
+    import numba
+except ImportError:
+    numba = None  # Optional: used to speed up point cloud recoloring, numpy is used if not installed
+
 
 def estimate_pc_normals_from_mesh(pc_vertices: np.ndarray, mesh: trimesh.base.Trimesh):
     """Approximate PC per-vertex normals from mesh that is registered to PC.
@@ -71,7 +76,7 @@ def estimate_normals_from_pointcloud(pc_vertices: np.ndarray, backend="open3d",
 
 def approximate_colors_from_camera(
         camera_viewdir: np.ndarray, vertex_normals: np.ndarray, per_vertex_color: Union[Vector3d, Vector4d],
-        back_color: Union[Vector3d, Vector4d] = (0.6, 0.6, 0.6)
+        back_color: Union[Vector3d, Vector4d] = (0.6, 0.6, 0.6), out: Optional[np.ndarray] = None
 ):
     """Approximation of visible vertices from camera.
     PC vertices are colored with their initial color only if they are visible from camera (here we use the approximation
@@ -80,45 +85,138 @@ def approximate_colors_from_camera(
 
     Args:
         camera_viewdir (np.ndarray): view direction of the camera
-        vertex_normals (np.ndarray): per-vertex normals of the point cloud
-        per_vertex_color (Union[Vector3d, Vector4d]): colors for the point cloud
+        vertex_normals (np.ndarray): per-vertex normals of the point cloud; when recoloring every frame,
+            convert them to a contiguous float32 array once beforehand to avoid any per-call conversion
+        per_vertex_color (Union[Vector3d, Vector4d]): colors for the point cloud; per-vertex colors are used as is
+            if they are a C-contiguous float32 array (e.g. VertexColors.vertex_colors), otherwise they are converted
         back_color (Union[Vector3d, Vector4d], optional): color for vertices that are not visible from camera. With
             the approximation of visibility, described above (default: (0.6, 0.6, 0.6))
+        out (np.ndarray, optional): preallocated float32 buffer of shape (n_vertices, 4) to write the result to,
+            allows to reuse the same memory when recoloring every frame, e.g. VertexColors.vertex_colors of
+            an existing VertexColors instance to update it in place (default: None)
 
     Returns:
         np.ndarray: new per-vertex coloring with invisible vertices colored in back_color
     """
-    # Add alpha
-    back_color = np.array(back_color)
-    if back_color.shape[0] == 3:
-        back_color = np.concatenate((back_color, [1.0]), axis=0)
+    # Convert back_color to float32 RGBA row matching the output buffer, so that it is broadcast without casting
+    back_color_rgba = np.ones(4, dtype=np.float32)
+    back_color_rgba[:len(back_color)] = back_color
 
-    # Expand colors if needed
+    # Check colors shape, uniform colors are broadcast by the kernel
     num_vertices = vertex_normals.shape[0]
-    per_vertex_color = np.array(per_vertex_color)
-    if per_vertex_color.ndim == 1:
-        per_vertex_color = np.repeat(per_vertex_color[np.newaxis], num_vertices, axis=0).astype(np.float32)
-    elif per_vertex_color.ndim == 2:
+    # Same layout and type as the output buffer, so that rows are copied without casting or strided access
+    per_vertex_color = np.ascontiguousarray(per_vertex_color, dtype=np.float32)
+    if per_vertex_color.ndim == 2:
         assert per_vertex_color.shape[0] == num_vertices, \
             "Length of vertex_colors is to be equal to the number of vertices."
-    else:
+    elif per_vertex_color.ndim != 1:
         raise NotImplementedError("Only uniform or per-vertex colors are supported for color approximation.")
 
-    # Add alpha to colors if needed
-    if per_vertex_color.shape[1] == 3:
-        per_vertex_color = np.concatenate((per_vertex_color, np.ones((num_vertices, 1), np.float32)), axis=1)
-
-    # Add alpha to support transparent back_color
-    if per_vertex_color.shape[1] == 3:
-        alpha = np.ones((per_vertex_color.shape[0], 1), dtype=np.float32)
-        vertex_colors = np.concatenate((per_vertex_color, alpha), axis=1)
+    # Preallocated RGBA buffer for the result (alpha is added to support transparent back_color)
+    if out is None:
+        out = np.empty((num_vertices, 4), dtype=np.float32)
+    else:
+        assert out.shape == (num_vertices, 4) and out.dtype == np.float32, \
+            f"Expected out buffer of shape ({num_vertices}, 4) and type float32, " \
+            f"got shape {out.shape} and type {out.dtype}"
 
     # Compute mask and recolor
-    dot_product = (vertex_normals * camera_viewdir[np.newaxis, :]).sum(axis=1)
-    back_mask = dot_product > 0.0
-    per_vertex_color[back_mask] = back_color[np.newaxis]
+    vertex_normals = np.asarray(vertex_normals)
+    # Match the dtype of the normals, otherwise matmul would upcast a copy of all the normals
+    camera_viewdir = np.asarray(camera_viewdir, dtype=vertex_normals.dtype)
+    _recolor_kernel(vertex_normals, camera_viewdir, per_vertex_color, back_color_rgba, out=out)
+
+    return out
+
+
+def _recolor_kernel(
+        vertex_normals: np.ndarray, camera_viewdir: np.ndarray, vertex_colors: np.ndarray, back_color: np.ndarray,
+        out: np.ndarray
+):
+    """Colors vertices facing away from the camera with back_color, the rest keep their vertex_colors.
+    Uses a compiled numba kernel if numba is installed, numpy implementation otherwise.
+
+    Args:
+        vertex_normals (np.ndarray): per-vertex normals of the point cloud (N, 3)
+        camera_viewdir (np.ndarray): view direction of the camera (3,)
+        vertex_colors (np.ndarray): RGB or RGBA colors of the point cloud (N, 3) / (N, 4) or a uniform color (3,) / (4,),
+            missing alpha is set to 1, can be the same array as out
+        back_color (np.ndarray): RGBA color for vertices that are not visible from camera (4,)
+        out (np.ndarray): float32 buffer of shape (N, 4) to write the result to
+    """
+    if vertex_colors.ndim == 1:
+        # Uniform color is handled as a constant RGBA row, in the same way as back_color
+        front_color = np.ones(4, dtype=np.float32)
+        front_color[:len(vertex_colors)] = vertex_colors
+        if numba is not None:
+            _recolor_kernel_uniform_numba(vertex_normals, camera_viewdir, front_color, back_color, out)
+        else:
+            _recolor_kernel_numpy(vertex_normals, camera_viewdir, front_color, back_color, out=out)
+    elif numba is not None:
+        _recolor_kernel_numba(vertex_normals, camera_viewdir, vertex_colors, back_color, out)
+    else:
+        _recolor_kernel_numpy(vertex_normals, camera_viewdir, vertex_colors, back_color, out=out)
+
+
+def _recolor_kernel_numpy(
+        vertex_normals: np.ndarray, camera_viewdir: np.ndarray, vertex_colors: np.ndarray, back_color: np.ndarray,
+        out: np.ndarray
+):
+    """Colors vertices facing away from the camera with back_color, the rest keep their vertex_colors.
+    Writes the result to the out buffer, the only per-vertex temporaries are the dot product and a single bool mask.
 
-    return per_vertex_color
+    Args:
+        vertex_normals (np.ndarray): per-vertex normals of the point cloud (N, 3)
+        camera_viewdir (np.ndarray): view direction of the camera (3,)
+        vertex_colors (np.ndarray): RGB or RGBA colors of the point cloud (N, 3) / (N, 4) or a uniform color (3,) / (4,),
+            missing alpha is set to 1, can be the same array as out
+        back_color (np.ndarray): RGBA color for vertices that are not visible from camera (4,)
+        out (np.ndarray): float32 buffer of shape (N, 4) to write the result to
+    """
+    dot_product = vertex_normals @ camera_viewdir
+    # The same bool buffer holds the front mask first and the back mask afterwards
+    mask = np.empty((len(dot_product), 1), dtype=np.bool_)
+    # Each row of out is written only once: either from vertex_colors (with alpha padding) or from back_color
+    if vertex_colors is not out:
+        np.less_equal(dot_product[:, np.newaxis], 0.0, out=mask)
+        num_channels = vertex_colors.shape[-1]
+        np.copyto(out[:, :num_channels], vertex_colors, where=mask)
+        if num_channels == 3:
+            np.copyto(out[:, 3:], 1.0, where=mask)
+    np.greater(dot_product[:, np.newaxis], 0.0, out=mask)
+    np.copyto(out, back_color, where=mask)
+
+
+if numba is not None:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _recolor_kernel_numba(vertex_normals, camera_viewdir, vertex_colors, back_color, out):
+        """Compiled version of _recolor_kernel_numpy: computes the dot product, the mask and the result in a single
+        parallel loop without any temporary arrays. Only per-vertex colors of shape (N, C) are supported
+        """
+        num_channels = vertex_colors.shape[1]
+        for i in numba.prange(vertex_normals.shape[0]):
+            dot_product = vertex_normals[i, 0] * camera_viewdir[0] + vertex_normals[i, 1] * camera_viewdir[1] + \
+                vertex_normals[i, 2] * camera_viewdir[2]
+            if dot_product > 0.0:
+                out[i, :] = back_color
+            else:
+                for channel in range(num_channels):
+                    out[i, channel] = vertex_colors[i, channel]
+                if num_channels == 3:
+                    out[i, 3] = 1.0
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _recolor_kernel_uniform_numba(vertex_normals, camera_viewdir, front_color, back_color, out):
+        """Version of _recolor_kernel_numba for uniform colors: each vertex gets either the RGBA front_color
+        or the RGBA back_color, so no per-vertex colors are read
+        """
+        for i in numba.prange(vertex_normals.shape[0]):
+            dot_product = vertex_normals[i, 0] * camera_viewdir[0] + vertex_normals[i, 1] * camera_viewdir[1] + \
+                vertex_normals[i, 2] * camera_viewdir[2]
+            if dot_product > 0.0:
+                out[i, :] = back_color
+            else:
+                out[i, :] = front_color
 
 
 class PCMeshifier:
@@ -16,10 +16,7 @@ def set_shadow_catcher(obj: Union[str, Renderable], state=False):
     if not isinstance(obj, str):
         obj = obj.tag
 
-    # select object
-    bpy.data.objects[obj].select_set(True)
-    bpy.context.view_layer.objects.active = bpy.data.objects[obj]
-    shadow_catcher = bpy.context.active_object
+    shadow_catcher = bpy.data.objects[obj]
 
     # set / unset shadow catcher properties
     shadow_catcher.is_shadow_catcher = state
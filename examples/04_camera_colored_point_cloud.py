@@ -56,6 +56,8 @@ def main(args):
         normals = np.array(mesh.vertex_normals)
     else:
         normals = estimate_normals_from_pointcloud(vertices, backend=args.backend, device="cpu" if args.cpu else "cuda")
+    # Convert normals once, so that no conversion happens during per-frame recoloring
+    normals = np.ascontiguousarray(normals, dtype=np.float32)
     # create material
     poincloud_material = PrincipledBSDFMaterial(specular=0.5)
     # create default color (will be changed in the rendering loop)
@@ -73,6 +75,8 @@ def main(args):
     # Render the video frame by frame
     logger.info("Entering the main drawing loop")
     total_frames = len(camera_trajectory)
+    # VertexColors instance for recolored per-vertex colors, its colors buffer is updated in place every frame
+    pointcloud_colors_new = VertexColors(np.ones((len(vertices), 4), dtype=np.float32))
     with VideoWriter(args.path, resolution=args.resolution, fps=30) as vw:
         for index, position in enumerate(camera_trajectory):
             logger.info(f"Rendering frame {index:03d} / {total_frames:03d}")
@@ -80,11 +84,11 @@ def main(args):
             camera.set_position(rotation=position["quaternion"], translation=position["position"])
             # Approximate colors from normals and camera_view_direction
             camera_viewdir = camera.get_camera_viewdir()
-            per_vertex_recolor = approximate_colors_from_camera(
-                camera_viewdir, normals, per_vertex_color=pointcloud_colors_init.color, back_color=(0.0, 0.0, 0.0, 0.0)
+            approximate_colors_from_camera(
+                camera_viewdir, normals, per_vertex_color=pointcloud_colors_init.color, back_color=(0.0, 0.0, 0.0, 0.0),
+                out=pointcloud_colors_new.vertex_colors
             )
-            # Create VertexColor instance and set it to the PointCloud
-            pointcloud_colors_new = VertexColors(per_vertex_recolor)
+            # Set updated VertexColors to the PointCloud
             pointcloud.update_colors(pointcloud_colors_new)
             # Render the scene to temporary image
             img = scene.render(use_gpu=not args.cpu, samples=args.n_samples)
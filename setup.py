@@ -47,6 +47,7 @@ utils_requirements = [
     "open3d",           # Utils: normals estimation, mesh reconstruction
     "smplx",            # Utils: smpl wrapper
     "torch",            # Utils: point cloud normals, texture generation
+    "numba",            # Utils: point cloud recoloring (optional, falls back to numpy)
 ]
 
 examples_requirements = utils_requirements + [